@@ -8,8 +8,25 @@
 Below code is incomplete.
 """
 from abc import ABC, abstractmethod
+import asyncio
 import time
 
+# The clip output goes through _emit so it can be swapped for a no-op, e.g. when benchmarking the beat loop,
+# where printing would otherwise dominate.
+_emit = print
+
+def _bpm_to_period_ns(bpm):
+    return int(6e10 / bpm)
+
+def _next_deadline(next_t, now_ns, period_ns):
+    """
+    Return the deadline of the beat after next_t, resynced to now_ns if next_t is more than a period late.
+    """
+    next_t += period_ns
+    if next_t - now_ns < -period_ns:
+        return now_ns
+    return next_t
+
 class AbsBeatModelInterface(ABC):
     """
     The model is responsible for maintaining all the data, state, and any application logic.
@@ -64,73 +81,186 @@ class AbsBeatModelInterface(ABC):
 class BeatModel(AbsBeatModelInterface):
 
     def __init__(self):
-        self.__beat_observers = []
-        self.__bpm_observers = []
-        self.__bpm = 90
-        self.__stop = False
+        # The model only ever notifies this composite, which fans the notification out to the observers.
+        self.__observer = CompositeObserver()
+        # The events anyone is listening to, so that unobserved events are skipped right away.
+        self.__observed_events = 0
+        self.__store_bpm(90)
+        # Identifies the current run() loop; any other loop stops at its next beat.
+        self.__run_token = None
+        self.__task = None
 
     def initialize(self):
         """
         This method does setup for the beat track.
         """
-        print('Clip opened')
+        _emit('Clip opened')
 
     def on(self):
-        self.__bpm = 90
+        self.__store_bpm(90)
         self.notify_bpm_observers()
-        self.__stop = False
 
     def off(self):
         self.__stop_beat()
-        self.__stop = True
+        self.__run_token = None
+        if self.__task is not None:
+            # Wake the pending sleep right away instead of waiting out the current period.
+            self.__task.cancel()
+            self.__task = None
 
-    def run(self):
-        while not self.__stop:
+    def start(self):
+        """
+        Schedule run() as a task on the running event loop, so the beat shares the thread with views and controllers.
+
+        If the beat is already running, its task is returned instead of starting a second one.
+        """
+        if self.__task is None or self.__task.done():
+            self.__task = asyncio.get_running_loop().create_task(self.run())
+        return self.__task
+
+    async def run(self):
+        """
+        Play a beat on every period.
+
+        The next beat is scheduled against an absolute deadline, so the time spent playing the beat
+        and notifying the observers does not drift the tempo. If a deadline is missed by more than
+        a whole period, the schedule is resynced to now instead of firing a burst of late beats.
+
+        The loop runs until off() is called or another run() starts, so there is only ever one beat.
+        """
+        token = self.__run_token = object()
+        next_t = time.monotonic_ns()
+        while self.__run_token is token:
             self.__play_beat()
             self.notify_beat_observers()
-            time.sleep(6e4 / self.get_bpm())
+            now = time.monotonic_ns()
+            next_t = _next_deadline(next_t, now, self.__period_ns)
+            delta = next_t - now
+            # Always await, even when late, so a slow beat still yields to the other tasks on the loop.
+            await asyncio.sleep(max(delta, 0) / 1e9)
 
     def __stop_beat(self):
-        print('Set clip to position 0')
-        print('Stop clip')
+        _emit('Set clip to position 0')
+        _emit('Stop clip')
 
     def __play_beat(self):
-        print('Set clip to position 0')
-        print('Play clip')
+        _emit('Set clip to position 0')
+        _emit('Play clip')
 
     def set_bpm(self, bpm):
+        self.__store_bpm(bpm)
+        self.notify_bpm_observers()
+
+    def __store_bpm(self, bpm):
+        # The beat period is derived here, the only place the bpm changes, so run() never recomputes it per beat.
+        # A bpm of zero or less has no period, and would otherwise make run() spin without ever sleeping.
+        if bpm <= 0:
+            raise ValueError(f'bpm must be positive, got {bpm}')
         self.__bpm = bpm
-        self.notify_bpm_observer()
+        self.__period_ns = _bpm_to_period_ns(bpm)
 
     def get_bpm(self):
         return self.__bpm
 
     def register_beat_observer(self, beat_observer):
-        self.__beat_observers.append(beat_observer)
+        self.__observer.add(beat_observer, BEAT)
+        self.__observed_events = self.__observer.get_events()
+
+    def remove_beat_observer(self, beat_observer):
+        self.__observer.remove(beat_observer, BEAT)
+        self.__observed_events = self.__observer.get_events()
 
     def register_bpm_observer(self, bpm_observer):
-        self.__bpm_observers.append(bpm_observer)
+        self.__observer.add(bpm_observer, BPM)
+        self.__observed_events = self.__observer.get_events()
+
+    def remove_bpm_observer(self, bpm_observer):
+        self.__observer.remove(bpm_observer, BPM)
+        self.__observed_events = self.__observer.get_events()
 
     def notify_beat_observers(self):
-        for observer in self.__beat_observers:
-            observer.update_beat()
+        if self.__observed_events & BEAT:
+            self.__observer.update(BEAT)
 
     def notify_bpm_observers(self):
-        for observer in self.__bpm_observers:
-            observer.update_bpm()
+        if self.__observed_events & BPM:
+            self.__observer.update(BPM)
 
-class AbsBeatObserver(ABC):
+# Events an observer can be notified of; an observer's subscriptions are a bit mask of them.
+BEAT = 1
+BPM = 2
+
+# The observer interfaces are plain classes; the @abstractmethod markers only document them,
+# which keeps isinstance() on observers a plain type check.
+class AbsModelObserver(object):
+    """
+    The model calls update_beat() and update_bpm() of its observers directly, as it has to once per beat.
+    """
+
+class AbsBeatObserver(AbsModelObserver):
 
     @abstractmethod
     def update_beat(self):
         pass
 
-class AbsBpmObserver(ABC):
+class AbsBpmObserver(AbsModelObserver):
 
     @abstractmethod
     def update_bpm(self):
         pass
 
+class CompositeObserver(AbsModelObserver):
+    """
+    An observer that notifies all the observers added to it of the events they subscribed to.
+
+    For every event, the observers' bound update_beat or update_bpm methods to call are precomputed,
+    so notifying an observer of an event is a single call. They are rebuilt, never mutated, on add and remove,
+    so an observer may add or remove observers while it is being notified; the change only affects
+    the next notification.
+
+    The observers are keyed by themselves, so they must be hashable, and adding an observer again for
+    an event it already subscribed to does not make it notified twice.
+    """
+
+    def __init__(self):
+        self.__subscriptions = {}
+        self.__fan_outs = {BEAT: (), BPM: ()}
+
+    def get_events(self):
+        """
+        The events at least one observer subscribed to.
+        """
+        events = 0
+        for subscribed in self.__subscriptions.values():
+            events |= subscribed
+        return events
+
+    def add(self, observer, events):
+        subscriptions = dict(self.__subscriptions)
+        subscriptions[observer] = subscriptions.get(observer, 0) | events
+        self.__set_subscriptions(subscriptions)
+
+    def remove(self, observer, events):
+        subscriptions = dict(self.__subscriptions)
+        subscribed = subscriptions.pop(observer, 0) & ~events
+        if subscribed:
+            subscriptions[observer] = subscribed
+        self.__set_subscriptions(subscriptions)
+
+    def __set_subscriptions(self, subscriptions):
+        fan_outs = {
+            BEAT: tuple(observer.update_beat for observer, subscribed in subscriptions.items() if subscribed & BEAT),
+            BPM: tuple(observer.update_bpm for observer, subscribed in subscriptions.items() if subscribed & BPM),
+        }
+        self.__subscriptions = subscriptions
+        self.__fan_outs = fan_outs
+
+    def update(self, event):
+        # A plain loop on purpose: its calls to the bound methods are Python-to-Python calls, which the
+        # interpreter runs without going through C, and that beats consuming them with deque(map(...)).
+        for update in self.__fan_outs[event]:
+            update()
+
 class DJView(AbsBeatObserver, AbsBpmObserver):
 
     def __init__(self, controller, beat_model):
@@ -13,9 +13,16 @@ Related OO Principles
 - Depend on abstraction. Do not depend on concrete classes.
 -
 """
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 
-class AbsCommand(ABC):
+# Output of the remote and the lights; replace it to silence them.
+_emit = print
+
+# Not an ABC, so the isinstance() checks done when loading commands are ordinary type checks.
+# The @abstractmethod markers are kept to document the interface.
+class AbsCommand(object):
+
+    __slots__ = ()
 
     @abstractmethod
     def execute(self):
@@ -34,6 +41,8 @@ class NullCommand(AbsCommand):
     A null command that does not do anything.
     """
 
+    __slots__ = ()
+
     def execute(self):
         """
         do nothing
@@ -46,25 +55,32 @@ class NullCommand(AbsCommand):
         """
         return
 
+# Global Object Pattern: the null command is stateless, so every empty slot can share a single instance
+_NULL_COMMAND = NullCommand()
+
 class Light(object):
     """
     A light that can turn on and off.
     """
 
+    __slots__ = ('__location',)
+
     def __init__(self, location):
         self.__location = location
 
     def on(self):
-        print(f'{self.__location} light is on')
+        _emit(f'{self.__location} light is on')
 
     def off(self):
-        print(f'{self.__location} light  is off')
+        _emit(f'{self.__location} light  is off')
 
 class LightOnCommand(AbsCommand):
     """
     Command to turn light on.
     """
 
+    __slots__ = ('__light',)
+
     def __init__(self, light):
         self.__light = light
 
@@ -79,6 +95,8 @@ class LightOffCommand(AbsCommand):
     Command to turn light off.
     """
 
+    __slots__ = ('__light',)
+
     def __init__(self, light):
         self.__light = light
 
@@ -93,18 +111,24 @@ class MacroCommand(AbsCommand):
     A macro command that encapsulates multiple commands.
     """
 
+    __slots__ = ('__execs', '__unexecs')
+
     def __init__(self, cmd_list):
-        for cmd in cmd_list:
-            assert isinstance(cmd, AbsCommand)
-        self.__cmd_list = cmd_list
+        if __debug__:
+            # A bare assert is already stripped by `python -O`, but the loop around it is not.
+            for cmd in cmd_list:
+                assert isinstance(cmd, AbsCommand)
+        # Bind the methods once here instead of looking them up on every button press.
+        self.__execs = tuple(cmd.execute for cmd in cmd_list)
+        self.__unexecs = tuple(cmd.unexecute for cmd in cmd_list)
 
     def execute(self):
-        for cmd in self.__cmd_list:
-            cmd.execute()
+        for execute in self.__execs:
+            execute()
 
     def unexecute(self):
-        for cmd in self.__cmd_list:
-            cmd.unexecute()
+        for unexecute in self.__unexecs:
+            unexecute()
 
 
 
@@ -119,11 +143,13 @@ class RemoteControl(object):
     The remote control is decoupled from the receivers.
     """
 
+    __slots__ = ('__on_cmds', '__off_cmds', '__last_cmd')
+
     def __init__(self, n_slots):
         # Initialize to null commands.
-        self.__on_cmds = [NullCommand() for _ in range(n_slots)]
-        self.__off_cmds = [NullCommand() for _ in range(n_slots)]
-        self.__last_cmd = NullCommand()
+        self.__on_cmds = [_NULL_COMMAND] * n_slots
+        self.__off_cmds = [_NULL_COMMAND] * n_slots
+        self.__last_cmd = _NULL_COMMAND
 
     def set_command(self, idx, on_cmd, off_cmd):
         # The remote does not care what command object has, as long as it implements the AbsCommand interface
@@ -134,17 +160,17 @@ class RemoteControl(object):
         self.__off_cmds[idx] = off_cmd
 
     def click_on(self, idx):
-        print(f'Clicking slot {idx} on button...')
+        _emit(f'Clicking slot {idx} on button...')
         self.__on_cmds[idx].execute()
         self.__last_cmd = self.__on_cmds[idx]
 
     def click_off(self, idx):
-        print(f'Clicking slot {idx} off button...')
+        _emit(f'Clicking slot {idx} off button...')
         self.__off_cmds[idx].execute()
         self.__last_cmd = self.__off_cmds[idx]
 
     def undo(self):
-        print('Undoing...')
+        _emit('Undoing...')
         self.__last_cmd.unexecute()
 
 class Main(object):
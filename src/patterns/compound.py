@@ -5,7 +5,11 @@ Below is not a compound pattern, it is just a set of patterns working together.
 """
 from abc import ABC, abstractmethod
 
-class AbsQuackObservable(ABC):
+# The quackable interfaces are plain classes rather than ABCs, as in strategy.AbsBadDuck, so that
+# isinstance() checks on them (e.g. in Flock.add) skip ABCMeta's subclass hook and cache.
+class AbsQuackObservable(object):
+
+    __slots__ = ()
 
     @abstractmethod
     def register_observer(self, observer):
@@ -17,82 +21,48 @@ class AbsQuackObservable(ABC):
 
 class AbsQuackable(AbsQuackObservable):
 
+    __slots__ = ()
+
     @abstractmethod
     def quack(self):
         pass
 
-class MallardDuck(AbsQuackable):
-
-    def __init__(self):
-        self.__observable = Observable(self)
-
-    def __str__(self):
-        return 'Mallard Duck'
-
-    def quack(self):
-        print('Quack')
-        self.notify_observer()
-
-    def register_observer(self, observer):
-        self.__observable.register_observer(observer)
-
-    def notify_observer(self):
-        self.__observable.notify_observer()
+# Observer Pattern
+# mixed into the quackables themselves, so notifying does not go through a separate Observable object
+class ObservableMixin(AbsQuackObservable):
 
-class RedHeadDuck(AbsQuackable):
+    __slots__ = ('__observers',)
 
     def __init__(self):
-        self.__observable = Observable(self)
-
-    def __str__(self):
-        return 'Red Head Duck'
-
-    def quack(self):
-        print('Quack')
-        self.notify_observer()
+        self.__observers = []
 
     def register_observer(self, observer):
-        self.__observable.register_observer(observer)
+        assert isinstance(observer, AbsObserver)
+        self.__observers.append(observer)
 
     def notify_observer(self):
-        self.__observable.notify_observer()
-
-class DuckCall(AbsQuackable):
-
-    def __init__(self):
-        self.__observable = Observable(self)
-
-    def __str__(self):
-        return 'Duck Call'
-
-    def quack(self):
-        print('Kwak')
-        self.notify_observer()
-
-    def register_observer(self, observer):
-        self.__observable.register_observer(observer)
+        for observer in self.__observers:
+            observer.update(self)
 
-    def notify_observer(self):
-        self.__observable.notify_observer()
+class Duck(ObservableMixin, AbsQuackable):
+    """
+    The ducks only differ in their name and the sound they make, so one class covers all of them.
+    """
 
-class RubberDuck(AbsQuackable):
+    __slots__ = ('__name', '__sound')
 
-    def __init__(self):
-        self.__observable = Observable(self)
+    def __init__(self, name, sound):
+        super().__init__()
+        self.__name = name
+        self.__sound = sound
 
     def __str__(self):
-        return 'Rubber Duck'
+        return self.__name
 
     def quack(self):
-        print('Squeak')
+        print(self.__sound)
         self.notify_observer()
 
-    def register_observer(self, observer):
-        self.__observable.register_observer(observer)
-
-    def notify_observer(self):
-        self.__observable.notify_observer()
-
 class Goose(object):
 
     def honk(self):
@@ -100,11 +70,13 @@ class Goose(object):
 
 # Adapter Pattern
 # adapt a goose to a duck
-class GooseAdapter(AbsQuackable):
+class GooseAdapter(ObservableMixin, AbsQuackable):
+
+    __slots__ = ('__goose',)
 
     def __init__(self, goose):
         assert isinstance(goose, Goose)
-        self.__observable = Observable(self)
+        super().__init__()
         self.__goose = goose
 
     def __str__(self):
@@ -114,29 +86,26 @@ class GooseAdapter(AbsQuackable):
         self.__goose.honk()
         self.notify_observer()
 
-    def register_observer(self, observer):
-        self.__observable.register_observer(observer)
-
-    def notify_observer(self):
-        self.__observable.notify_observer()
-
 # Decorator Pattern
 # give the ducks some new behavior by wrapping them with a decorator object
-NUM_QUACKS = 0
 class QuackCounter(AbsQuackable):
 
+    __slots__ = ('__duck',)
+
+    # Shared by all the counters, rather than a module global that every quack has to rebind
+    __num_quacks = 0
+
     def __init__(self, duck):
         assert isinstance(duck, AbsQuackable)
         self.__duck = duck
 
     def quack(self):
         self.__duck.quack()
-        global NUM_QUACKS
-        NUM_QUACKS += 1
+        QuackCounter.__num_quacks += 1
 
     @classmethod
     def get_quacks(cls):
-        return NUM_QUACKS
+        return QuackCounter.__num_quacks
 
     def register_observer(self, observer):
         self.__duck.register_observer(observer)
@@ -168,70 +137,118 @@ class AbstractDuckFactory(ABC):
 class DuckFactory(AbstractDuckFactory):
 
     def create_MallardDuck(self):
-        return MallardDuck()
+        return Duck('Mallard Duck', 'Quack')
 
     def create_RedHeadDuck(self):
-        return RedHeadDuck()
+        return Duck('Red Head Duck', 'Quack')
 
     def create_DuckCall(self):
-        return DuckCall()
+        return Duck('Duck Call', 'Kwak')
 
     def create_RubberDuck(self):
-        return RubberDuck()
+        return Duck('Rubber Duck', 'Squeak')
 
 class CountingDuckFactory(AbstractDuckFactory):
 
     def create_MallardDuck(self):
-        return QuackCounter(MallardDuck())
+        return QuackCounter(Duck('Mallard Duck', 'Quack'))
 
     def create_RedHeadDuck(self):
-        return QuackCounter(RedHeadDuck())
+        return QuackCounter(Duck('Red Head Duck', 'Quack'))
 
     def create_DuckCall(self):
-        return QuackCounter(DuckCall())
+        return QuackCounter(Duck('Duck Call', 'Kwak'))
 
     def create_RubberDuck(self):
-        return QuackCounter(RubberDuck())
+        return QuackCounter(Duck('Rubber Duck', 'Squeak'))
 
 # Composite and Iterator Pattern
 # Allow us to treat a collections of objects in the same way as individual objects
 class Flock(AbsQuackable):
 
+    __slots__ = ('__quackers', '__leaves', '__leaf_quacks', '__parents')
+
     def __init__(self):
         super().__init__()
         self.__quackers = []
+        # The non-flock quackers of the whole tree below this flock, so quacking is a flat loop, not a recursion.
+        # Adding drops them, also in the flocks this one was added to, and they are rebuilt when next needed,
+        # so building a flock one quacker at a time does not rebuild them on every add.
+        self.__leaves = ()
+        self.__leaf_quacks = ()
+        self.__parents = []
 
     def add(self, quacker):
         assert isinstance(quacker, AbsQuackable)
+        if isinstance(quacker, Flock):
+            if self in quacker.__flocks():
+                raise ValueError('A flock cannot be added to itself or to a flock it contains')
+            quacker.__parents.append(self)
         self.__quackers.append(quacker)
+        self.__invalidate_leaves()
+
+    def __flocks(self):
+        """
+        This flock and every flock in it, directly or not, each once.
+        """
+        seen = {self}
+        stack = [self]
+        while stack:
+            for quacker in stack.pop().__quackers:
+                if isinstance(quacker, Flock) and quacker not in seen:
+                    seen.add(quacker)
+                    stack.append(quacker)
+        return seen
+
+    def __invalidate_leaves(self):
+        # A flock whose leaves are already dropped has had them dropped in its enclosing flocks too,
+        # so the walk up stops there.
+        stack = [self]
+        while stack:
+            flock = stack.pop()
+            if flock.__leaves is not None:
+                flock.__leaves = flock.__leaf_quacks = None
+                stack.extend(flock.__parents)
+
+    def __rebuild_leaves(self):
+        # Rebuild the flocks below this one before the flocks they are in, with an explicit stack rather than
+        # recursion, so arbitrarily deep nesting cannot exhaust the Python call stack.
+        stack = [self]
+        while stack:
+            flock = stack[-1]
+            if flock.__leaves is not None:
+                stack.pop()
+                continue
+            stale = [quacker for quacker in flock.__quackers
+                     if isinstance(quacker, Flock) and quacker.__leaves is None]
+            if stale:
+                stack.extend(stale)
+                continue
+            stack.pop()
+            leaves = []
+            for quacker in flock.__quackers:
+                if isinstance(quacker, Flock):
+                    leaves.extend(quacker.__leaves)
+                else:
+                    leaves.append(quacker)
+            flock.__leaves = tuple(leaves)
+            flock.__leaf_quacks = tuple(leaf.quack for leaf in leaves)
 
     def quack(self):
-        for quacker in self.__quackers:
-            quacker.quack()
+        if self.__leaf_quacks is None:
+            self.__rebuild_leaves()
+        for quack in self.__leaf_quacks:
+            quack()
 
     def register_observer(self, observer):
-        for quacker in self.__quackers:
-            quacker.register_observer(observer)
+        if self.__leaves is None:
+            self.__rebuild_leaves()
+        for leaf in self.__leaves:
+            leaf.register_observer(observer)
 
     def notify_observer(self):
         pass
 
-# Observer Pattern
-class Observable(AbsQuackObservable):
-
-    def __init__(self, duck):
-        assert isinstance(duck, AbsQuackObservable)
-        self.__observers = []
-        self.__duck = duck
-
-    def register_observer(self, observer):
-        assert isinstance(observer, AbsObserver)
-        self.__observers.append(observer)
-
-    def notify_observer(self):
-        for observer in self.__observers:
-            observer.update(self.__duck)
-
 class AbsObserver(ABC):
 
     @abstractmethod
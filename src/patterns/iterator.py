@@ -32,11 +32,20 @@ class OddNumbers(object):
         self.maximum = maximum
 
     def __iter__(self):
-        return OddIterator(self)
+        """
+        A generator function is the idiomatic way to write __iter__(): Python builds the iterator for us,
+        and the running number lives in a local variable instead of an attribute of an iterator object.
+        """
+        n = 1
+        maximum = self.maximum
+        while n <= maximum:
+            yield n
+            n += 2
 
 class OddIterator(object):
     """
-    An iterator.
+    An iterator written out by hand, equivalent to the generator returned by OddNumbers.__iter__().
+    Kept to show the iterator protocol that the generator implements for us.
 
     - Each iterator must offer a __next__() method that returns the next item from the container each time it is called.
       It should raise StopIterator when there are no further items.
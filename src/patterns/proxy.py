@@ -11,6 +11,9 @@ Proxy Pattern
 """
 from abc import ABC, abstractmethod
 
+# Output of the proxy; replace it to silence the loading messages.
+_emit = print
+
 class AbsIcon(ABC):
     """
     Interface for both the real subject and the proxy.
@@ -58,25 +61,23 @@ class ImageProxy(AbsIcon):
         self.__image_icon = None
 
     def get_icon_width(self):
-        if self.__image_icon is not None:
-            return self.__image_icon.get_icon_width()
         return 800
 
     def get_icon_height(self):
-        if self.__image_icon is not None:
-            return self.__image_icon.get_icon_height()
         return 600
 
     def paint_icon(self):
-        if self.__image_icon is not None:
+        _emit('Loading album cover, please wait...')
+        try:
+            self.__image_icon = ImageIcon(self.__image_url)
+            # Once loaded, shadow the proxy's methods with the real subject's,
+            # so later calls go straight to it instead of checking whether it is loaded yet.
+            self.get_icon_width = self.__image_icon.get_icon_width
+            self.get_icon_height = self.__image_icon.get_icon_height
+            self.paint_icon = self.__image_icon.paint_icon
             self.__image_icon.paint_icon()
-        else:
-            print('Loading album cover, please wait...')
-            try:
-                self.__image_icon = ImageIcon(self.__image_url)
-                self.__image_icon.paint_icon()
-            except BaseException as e:
-                print(f'Unable to instantiate ImageIcon due to {e}')
+        except BaseException as e:
+            _emit(f'Unable to instantiate ImageIcon due to {e}')
 
 if __name__ == '__main__':
     image_url = 'https://abc.img'
@@ -16,31 +16,40 @@ The Singleton Pattern in Python suffers from several drawbacks:
 - Modules are "singleton" in Python, because import only creates a single copy of each module;
   subsequent imports of the same name keep returning the same module object
 """
+from functools import lru_cache
+import threading
 
 # Gang of Four implementation
 class Logger(object):
 
     __instance = None
+    __lock = threading.Lock()
 
     def __init__(self):
         raise RuntimeError('Call instance() instead')
 
     @classmethod
     def instance(cls):
+        # Double-checked locking: only the first calls, racing to create the instance, pay for the lock
         if cls.__instance is None:
-            print('Creating new instance')
-            cls.__instance = cls.__new__(cls)
+            with cls.__lock:
+                if cls.__instance is None:
+                    print('Creating new instance')
+                    cls.__instance = cls.__new__(cls)
         return cls.__instance
 
 # More Pythonic implementation
 class MorePythonicLogger(object):
 
     __instance = None
+    __lock = threading.Lock()
 
     def __new__(cls, *args, **kwargs):
         if cls.__instance is None:
-            print('Creating new instance')
-            cls.__instance = super(MorePythonicLogger, cls).__new__(cls)
+            with cls.__lock:
+                if cls.__instance is None:
+                    print('Creating new instance')
+                    cls.__instance = super(MorePythonicLogger, cls).__new__(cls)
         return cls.__instance
 
     def __init__(self, a):
@@ -52,14 +61,32 @@ class MorePythonicLogger(object):
 class RegionConfig(object):
 
     __instance = {}
+    # One lock per region, so that creating the config of one region does not hold up the others
+    __locks = {}
+    __locks_lock = threading.Lock()
+
     def __init__(self, region):
         self.__region = region
 
     @classmethod
+    @lru_cache(maxsize=None)
     def create_instance(cls, region):
-        if region not in cls.__instance:
-            cls.__instance[region] = cls(region)
-        return cls.__instance[region]
+        # lru_cache answers repeated calls in C. It may still let racing first calls through for the same region,
+        # which is why those go on to the locked lookup below, so they all get the same instance.
+        return cls.__get_or_create(region)
+
+    @classmethod
+    def __get_or_create(cls, region):
+        instance = cls.__instance.get(region)
+        if instance is not None:
+            return instance
+        with cls.__locks_lock:
+            region_lock = cls.__locks.setdefault(region, threading.Lock())
+        with region_lock:
+            instance = cls.__instance.get(region)
+            if instance is None:
+                instance = cls.__instance[region] = cls(region)
+        return instance
 
 
 class Main(object):
@@ -14,10 +14,14 @@ OO Principle
 - Encapsulate what varies
 """
 from abc import ABC, abstractmethod
-from enum import Enum
-import numpy as np
+from enum import IntEnum
+from typing import Protocol
+import random
 
-class GumballState(Enum):
+# Output of the gumball machines; replace it to silence them.
+_emit = print
+
+class GumballState(IntEnum):
 
     SOLD_OUT = 0
     NO_QUARTER = 1
@@ -26,6 +30,8 @@ class GumballState(Enum):
 
 class AbsGumballMachine(ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def insert_quarter(self):
         pass
@@ -43,64 +49,70 @@ class MessyGumballMachine(AbsGumballMachine):
     """
     How to implement one in ten get a free gumball?
     - You have to add a new conditional in every single method to handle the WINNER state
+      (or, with the transition table below, a new entry for every single action)
     - turn_crank will be especially messy, because you have to add code to check whether you've got a winner
       and then switch to either the WINNER or the SOLD state
     """
 
+    def __sell(self, output):
+        self.__count -= 1
+        if self.__count == 0:
+            output.append('Oops, out of gumball')
+            return GumballState.SOLD_OUT
+        return GumballState.NO_QUARTER
+
+    # Table-driven version of the conditionals: (state, action) -> (message, next state).
+    # The next state is None to stay, or a method returning it when it depends on the machine,
+    # which may add more output lines.
+    # Each action is then a single lookup instead of a chain of comparisons on the state.
+    _TRANSITIONS = {
+        (GumballState.HAS_QUARTER, 'insert_quarter'): ('There is already a quarter. You cannot insert another', None),
+        (GumballState.NO_QUARTER, 'insert_quarter'): ('You inserted a quarter', GumballState.HAS_QUARTER),
+        (GumballState.SOLD_OUT, 'insert_quarter'): ('You cannot insert a quarter, the machine is sold out.', None),
+        (GumballState.SOLD, 'insert_quarter'): ('Please wait, we are already giving you a gumball', None),
+
+        (GumballState.HAS_QUARTER, 'eject_quarter'): ('Quarter returned', GumballState.NO_QUARTER),
+        (GumballState.NO_QUARTER, 'eject_quarter'): ('You have not inserted a quarter', None),
+        (GumballState.SOLD_OUT, 'eject_quarter'): ('You cannot eject, you have not inserted a quarter yet.', None),
+        (GumballState.SOLD, 'eject_quarter'): ('Sorry, you already turned the crank', None),
+
+        (GumballState.HAS_QUARTER, 'turn_crank'): ('You turned...', GumballState.SOLD),
+        (GumballState.NO_QUARTER, 'turn_crank'): ('You turned, but there is no quarter', None),
+        (GumballState.SOLD_OUT, 'turn_crank'): ('You turned, but there are no gumballs', None),
+        (GumballState.SOLD, 'turn_crank'): ('Turning twice does not give you another gumball', None),
+
+        (GumballState.HAS_QUARTER, 'dispense'): ('No gumball dispensed', None),
+        (GumballState.NO_QUARTER, 'dispense'): ('You need to pay first', None),
+        (GumballState.SOLD_OUT, 'dispense'): ('No gumball dispensed', None),
+        (GumballState.SOLD, 'dispense'): ('A gumball comes rolling out the slot...', __sell),
+    }
+
     def __init__(self, count):
         self.__count = count
         self.__state = GumballState.SOLD_OUT
         if self.__count > 0:
             self.__state = GumballState.NO_QUARTER
 
+    def __dispatch(self, action):
+        message, next_state = self._TRANSITIONS[self.__state, action]
+        output = [message]
+        if callable(next_state):
+            next_state = next_state(self, output)
+        if next_state is not None:
+            self.__state = next_state
+        _emit('\n'.join(output))
+
     def insert_quarter(self):
-        if self.__state == GumballState.HAS_QUARTER:
-            print('There is already a quarter. You cannot insert another')
-        elif self.__state == GumballState.NO_QUARTER:
-            self.__state = GumballState.HAS_QUARTER
-            print('You inserted a quarter')
-        elif self.__state == GumballState.SOLD_OUT:
-            print('You cannot insert a quarter, the machine is sold out.')
-        elif self.__state == GumballState.SOLD:
-            print('Please wait, we are already giving you a gumball')
+        self.__dispatch('insert_quarter')
 
     def eject_quarter(self):
-        if self.__state == GumballState.HAS_QUARTER:
-            print('Quarter returned')
-            self.__state = GumballState.NO_QUARTER
-        elif self.__state == GumballState.NO_QUARTER:
-            print('You have not inserted a quarter')
-        elif self.__state == GumballState.SOLD_OUT:
-            print('You cannot eject, you have not inserted a quarter yet.')
-        elif self.__state == GumballState.SOLD:
-            print('Sorry, you already turned the crank')
+        self.__dispatch('eject_quarter')
 
     def turn_crank(self):
-        if self.__state == GumballState.HAS_QUARTER:
-            print('You turned...')
-            self.__state = GumballState.SOLD
-        elif self.__state == GumballState.NO_QUARTER:
-            print('You turned, but there is no quarter')
-        elif self.__state == GumballState.SOLD_OUT:
-            print('You turned, but there are no gumballs')
-        elif self.__state == GumballState.SOLD:
-            print('Turning twice does not give you another gumball')
+        self.__dispatch('turn_crank')
 
     def dispense(self):
-        if self.__state == GumballState.HAS_QUARTER:
-            print('No gumball dispensed')
-        elif self.__state == GumballState.NO_QUARTER:
-            print('You need to pay first')
-        elif self.__state == GumballState.SOLD_OUT:
-            print('No gumball dispensed')
-        elif self.__state == GumballState.SOLD:
-            print('A gumball comes rolling out the slot...')
-            self.__count -= 1
-            if self.__count == 0:
-                print('Oops, out of gumball')
-                self.__state = GumballState.SOLD_OUT
-            else:
-                self.__state = GumballState.NO_QUARTER
+        self.__dispatch('dispense')
 
 class GumballMachine(AbsGumballMachine):
     """
@@ -112,191 +124,271 @@ class GumballMachine(AbsGumballMachine):
       the good thing is these classes are not exposed to clients and we avoid the conditional statements.
     """
 
-    def __init__(self, num_gumball):
-        self.__sold_out_state = SoldOutState(self)
-        self.__no_quarter_state = NoQuarterState(self)
-        self.__has_quarter_state = HasQuarterState(self)
-        self.__sold_state = SoldState(self)
-        self.__winner_state = WinnerState(self)
+    __slots__ = ('__count', '__state', '__output')
 
+    def __init__(self, num_gumball):
         self.__count = num_gumball
+        # Lines displayed during the current action, written out together once it is done;
+        # None outside an action, when they are written out right away
+        self.__output = None
         self.__state = None
         if self.__count > 0:
-            self.__state = self.__no_quarter_state
+            self.__state = _NO_QUARTER_STATE
         else:
-            self.__state = self.__sold_out_state
+            self.__state = _SOLD_OUT_STATE
 
     def __str__(self):
         return f'************** Gumball machine with {self.__count} gumballs left ******************'
 
     def insert_quarter(self):
-        self.__state.insert_quarter()
+        self.__run(self.__state.insert_quarter)
 
     def eject_quarter(self):
-        self.__state.eject_quarter()
+        self.__run(self.__state.eject_quarter)
 
     def turn_crank(self):
-        self.__state.turn_crank()
-        self.__state.dispense()
+        self.__run(self.__state.act)
+
+    def __run(self, action):
+        self.__output = []
+        try:
+            action(self)
+        finally:
+            output, self.__output = self.__output, None
+            if output:
+                _emit('\n'.join(output))
+
+    def display(self, message):
+        if self.__output is None:
+            _emit(message)
+        else:
+            self.__output.append(message)
 
-    def set_state(self, state):
+    def set_state(self, state: 'AbsState'):
         self.__state = state
 
-    def release_ball(self):
+    def release_ball(self, n=1):
         """
         This public method is a bit strange to me. Can you call this method at any time?
+
+        Releases up to n gumballs at once, never more than there are left.
         """
-        print('A gumball comes rolling out the slot...')
-        if self.__count > 0:
-            self.__count -= 1
+        taken = min(n, self.__count)
+        self.__count -= taken
+        if taken > 1:
+            self.display(f'{taken} gumballs come rolling out the slot...')
+        else:
+            self.display('A gumball comes rolling out the slot...')
 
     def get_has_quarter_state(self):
-        return self.__has_quarter_state
+        return _HAS_QUARTER_STATE
 
     def get_no_quarter_state(self):
-        return self.__no_quarter_state
+        return _NO_QUARTER_STATE
 
     def get_sold_state(self):
-        return self.__sold_state
+        return _SOLD_STATE
 
     def get_sold_out_state(self):
-        return self.__sold_out_state
+        return _SOLD_OUT_STATE
 
     def get_winner_state(self):
-        return self.__winner_state
+        return _WINNER_STATE
 
     def get_count(self):
         return self.__count
 
-class AbsState(ABC):
+class AbsState(Protocol):
+    """
+    The interface of the states. It is a protocol, so the states implement it without inheriting from it.
+
+    The states hold no per-machine data: the machine is passed to every action instead.
+    So a single instance of each state is shared by all the gumball machines (the Flyweight Pattern),
+    and the states switch the machine to one another directly rather than asking it for them.
+    """
 
-    @abstractmethod
-    def insert_quarter(self):
+    def insert_quarter(self, gumball_machine):
         pass
 
-    @abstractmethod
-    def eject_quarter(self):
+    def eject_quarter(self, gumball_machine):
         pass
 
-    @abstractmethod
-    def turn_crank(self):
+    def turn_crank(self, gumball_machine):
         pass
 
-    @abstractmethod
-    def dispense(self):
+    def dispense(self, gumball_machine):
         pass
 
-class NoQuarterState(AbsState):
+    def act(self, gumball_machine):
+        """
+        Turn the crank and dispense in a single step.
+        """
 
-    def __init__(self, gumball_machine):
-        self.__gumball_machine = gumball_machine
+class NoQuarterState(object):
 
-    def insert_quarter(self):
-        print('You inserted a quarter')
-        self.__gumball_machine.set_state(self.__gumball_machine.get_has_quarter_state())
+    __slots__ = ()
 
-    def eject_quarter(self):
-        print('You have not inserted a quarter')
+    def insert_quarter(self, gumball_machine):
+        gumball_machine.display('You inserted a quarter')
+        gumball_machine.set_state(_HAS_QUARTER_STATE)
 
-    def turn_crank(self):
-        print('You turned, but there is no quarter')
+    def eject_quarter(self, gumball_machine):
+        gumball_machine.display('You have not inserted a quarter')
 
-    def dispense(self):
-        print('You need to pay first')
+    def turn_crank(self, gumball_machine):
+        gumball_machine.display('You turned, but there is no quarter')
 
-class HasQuarterState(AbsState):
+    def dispense(self, gumball_machine):
+        gumball_machine.display('You need to pay first')
 
-    def __init__(self, gumball_machine):
-        self.__gumball_machine = gumball_machine
-        np.random.seed(0)
+    def act(self, gumball_machine):
+        self.turn_crank(gumball_machine)
+        self.dispense(gumball_machine)
 
-    def insert_quarter(self):
-        print('There is already a quarter. You cannot insert another')
+class HasQuarterState(object):
 
-    def eject_quarter(self):
-        print('Quarter returned')
-        self.__gumball_machine.set_state(self.__gumball_machine.get_no_quarter_state())
+    __slots__ = ()
 
-    def turn_crank(self):
-        print('You turned...')
-        winner = np.random.randint(10)
-        if winner == 0 and self.__gumball_machine.get_count() > 1:
-            self.__gumball_machine.set_state(self.__gumball_machine.get_winner_state())
-        else:
-            self.__gumball_machine.set_state(self.__gumball_machine.get_sold_state())
+    # Seeded once, when the class is defined; a generator of its own keeps the draws reproducible
+    # without touching any global random state
+    __rng = random.Random(0)
 
-    def dispense(self):
-        print('No gumball dispensed')
+    def insert_quarter(self, gumball_machine):
+        gumball_machine.display('There is already a quarter. You cannot insert another')
 
-class SoldState(AbsState):
+    def eject_quarter(self, gumball_machine):
+        gumball_machine.display('Quarter returned')
+        gumball_machine.set_state(_NO_QUARTER_STATE)
 
-    def __init__(self, gumball_machine):
-        self.__gumball_machine = gumball_machine
+    def turn_crank(self, gumball_machine):
+        """
+        The GumballMachine turns the crank through act(); this is the step on its own, for the protocol.
+        """
+        gumball_machine.set_state(self.__turn(gumball_machine))
 
-    def insert_quarter(self):
-        print('Please wait, we are already giving you a gumball')
+    def dispense(self, gumball_machine):
+        gumball_machine.display('No gumball dispensed')
 
-    def eject_quarter(self):
-        print('Sorry, you already turned the crank')
+    def act(self, gumball_machine):
+        # Dispense from the drawn state right away, rather than making it the current state first
+        self.__turn(gumball_machine).dispense(gumball_machine)
 
-    def turn_crank(self):
-        print('Turning twice does not give you another gumball')
+    def __turn(self, gumball_machine):
+        """
+        Turn the crank and draw the state to dispense from.
+        """
+        gumball_machine.display('You turned...')
+        winner = self.__rng.randrange(10)
+        if winner == 0 and gumball_machine.get_count() > 1:
+            return _WINNER_STATE
+        return _SOLD_STATE
 
-    def dispense(self):
-        self.__gumball_machine.release_ball()
-        if self.__gumball_machine.get_count() > 0:
-            self.__gumball_machine.set_state(self.__gumball_machine.get_no_quarter_state())
-        else:
-            print('Oops, out of gumball')
-            self.__gumball_machine.set_state(self.__gumball_machine.get_sold_out_state())
+class SoldState(object):
 
-class SoldOutState(AbsState):
+    __slots__ = ()
 
-    def __init__(self, gumball_machine):
-        self.__gumball_machine = gumball_machine
+    def insert_quarter(self, gumball_machine):
+        gumball_machine.display('Please wait, we are already giving you a gumball')
 
-    def insert_quarter(self):
-        print('You cannot insert a quarter, the machine is sold out.')
+    def eject_quarter(self, gumball_machine):
+        gumball_machine.display('Sorry, you already turned the crank')
 
-    def eject_quarter(self):
-        print('You cannot eject, you have not inserted a quarter yet.')
+    def turn_crank(self, gumball_machine):
+        gumball_machine.display('Turning twice does not give you another gumball')
 
-    def turn_crank(self):
-        print('You turned, but there are no gumballs')
+    def dispense(self, gumball_machine):
+        gumball_machine.release_ball()
+        if gumball_machine.get_count() > 0:
+            gumball_machine.set_state(_NO_QUARTER_STATE)
+        else:
+            gumball_machine.display('Oops, out of gumball')
+            gumball_machine.set_state(_SOLD_OUT_STATE)
 
-    def dispense(self):
-        print('No gumball dispensed')
+    def act(self, gumball_machine):
+        self.turn_crank(gumball_machine)
+        self.dispense(gumball_machine)
 
-class WinnerState(SoldState):
+class SoldOutState(object):
 
-    def __init__(self, gumball_machine):
-        self.__gumball_machine = gumball_machine
+    __slots__ = ()
 
-    def insert_quarter(self):
-        print('Please wait, we are already giving you a gumball')
+    def insert_quarter(self, gumball_machine):
+        gumball_machine.display('You cannot insert a quarter, the machine is sold out.')
 
-    def eject_quarter(self):
-        print('Sorry, you already turned the crank')
+    def eject_quarter(self, gumball_machine):
+        gumball_machine.display('You cannot eject, you have not inserted a quarter yet.')
 
-    def turn_crank(self):
-        print('Turning twice does not give you another gumball')
+    def turn_crank(self, gumball_machine):
+        gumball_machine.display('You turned, but there are no gumballs')
 
-    def dispense(self):
+    def dispense(self, gumball_machine):
+        gumball_machine.display('No gumball dispensed')
+
+    def act(self, gumball_machine):
+        self.turn_crank(gumball_machine)
+        self.dispense(gumball_machine)
+
+class WinnerState(SoldState):
+    """
+    Behaves like SoldState, except that it dispenses two gumballs.
+    """
+
+    __slots__ = ()
+
+    def dispense(self, gumball_machine):
         """
         Dispense twice when gumball machine has enough gumballs.
         """
-        self.__gumball_machine.release_ball()
-        if self.__gumball_machine.get_count() == 0:
-            self.__gumball_machine.set_state(self.__gumball_machine.get_sold_out_state())
+        is_winner = gumball_machine.get_count() > 1
+        gumball_machine.release_ball(2)
+        if is_winner:
+            gumball_machine.display('You are a winner. You got two gumballs for your quarter')
+        if gumball_machine.get_count() > 0:
+            gumball_machine.set_state(_NO_QUARTER_STATE)
         else:
-            self.__gumball_machine.release_ball()
-            print('You are a winner. You got two gumballs for your quarter')
-            if self.__gumball_machine.get_count() > 0:
-                self.__gumball_machine.set_state(self.__gumball_machine.get_no_quarter_state())
-            else:
-                print('Oops, out of gumball')
-                self.__gumball_machine.set_state(self.__gumball_machine.get_sold_out_state())
-
+            if is_winner:
+                gumball_machine.display('Oops, out of gumball')
+            gumball_machine.set_state(_SOLD_OUT_STATE)
+
+_SOLD_OUT_STATE = SoldOutState()
+_NO_QUARTER_STATE = NoQuarterState()
+_HAS_QUARTER_STATE = HasQuarterState()
+_SOLD_STATE = SoldState()
+_WINNER_STATE = WinnerState()
+
+# Bulk simulation
+# The same machine as a plain integer state table, for running many actions without the output or the state objects.
+INSERT_QUARTER, EJECT_QUARTER, TURN_CRANK = range(3)
+
+_SOLD_OUT, _NO_QUARTER, _HAS_QUARTER, _SOLD = (state.value for state in GumballState)
+
+# _NEXT_STATE[state][action] is the state after the action, or -1 when the action changes nothing.
+_NEXT_STATE = [
+    [-1, -1, -1],                       # SOLD_OUT
+    [_HAS_QUARTER, -1, -1],             # NO_QUARTER
+    [-1, _NO_QUARTER, _SOLD],           # HAS_QUARTER
+    [-1, -1, -1],                       # SOLD, only passed through while dispensing
+]
+
+def simulate(num_gumball, actions, seed=0):
+    """
+    Run the actions (INSERT_QUARTER, EJECT_QUARTER or TURN_CRANK) on a new machine, silently.
+    Returns the final GumballState and the number of gumballs left.
+    """
+    rng = random.Random(seed)
+    next_state = _NEXT_STATE
+    count = num_gumball
+    state = _NO_QUARTER if count > 0 else _SOLD_OUT
+    for action in actions:
+        nxt = next_state[state][action]
+        if nxt < 0:
+            continue
+        if nxt == _SOLD:
+            # Dispense right away, two gumballs for a winner
+            count -= 2 if rng.randrange(10) == 0 and count > 1 else 1
+            nxt = _NO_QUARTER if count > 0 else _SOLD_OUT
+        state = nxt
+    return GumballState(state), count
 
 
 if __name__ == '__main__':
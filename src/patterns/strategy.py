@@ -6,6 +6,7 @@ The essence of Strategy Pattern is - using composition instead of inheritance, b
 """
 from abc import ABC
 from abc import abstractmethod
+from typing import Protocol
 
 # Below is bad design pattern using inheritance
 class AbsBadDuck(object):
@@ -43,60 +44,60 @@ class BadMountDuck(AbsBadDuck):
         print('Can fly')
 
 # Below is the correct design pattern using Strategy Pattern
+# The behavior interfaces are protocols: a behavior only needs the right method, not a common base class.
 
-class AbsFlyBehavior(ABC):
+class AbsFlyBehavior(Protocol):
 
-    @abstractmethod
     def perform_fly(self):
         pass
 
-class CanFly(AbsFlyBehavior):
+class CanFly(object):
 
     def perform_fly(self):
         print('Can fly')
 
-class CannotFly(AbsFlyBehavior):
+class CannotFly(object):
 
     def perform_fly(self):
         print('Cannot fly')
 
-class AbsQuackBehavior(ABC):
+class AbsQuackBehavior(Protocol):
 
-    @abstractmethod
     def perform_quack(self):
         pass
 
-class Quack(AbsQuackBehavior):
+class Quack(object):
 
     def perform_quack(self):
         print('quack')
 
-class MuteQuack(AbsQuackBehavior):
+class MuteQuack(object):
 
     def perform_quack(self):
         print('<< Silence >>')
 
-class AbsDuck(ABC):
+# The behaviors are stateless, so all the ducks can share one instance of each (Global Object Pattern)
+CAN_FLY = CanFly()
+CANNOT_FLY = CannotFly()
+QUACK = Quack()
+MUTE_QUACK = MuteQuack()
 
-    def __int__(self, fly_behavior, quack_behavior):
-        assert isinstance(fly_behavior, AbsFlyBehavior)
-        assert isinstance(quack_behavior, AbsQuackBehavior)
-        self.__fly_behavior = fly_behavior
-        self.__quack_behavior = quack_behavior
-
-    def fly(self):
-        self.__fly_behavior.perform_fly()
+class AbsDuck(ABC):
 
-    def quack(self):
-        self.__quack_behavior.perform_quack()
+    # The behaviors' types are declared for a static type checker instead of being asserted on every construction.
+    def __init__(self, fly_behavior: AbsFlyBehavior, quack_behavior: AbsQuackBehavior):
+        # The behaviors' methods become the duck's own fly() and quack(),
+        # so calling them is one call instead of a lookup of the behavior followed by a call on it.
+        self.fly = fly_behavior.perform_fly
+        self.quack = quack_behavior.perform_quack
 
     def swim(self):
         print('All ducks swim!')
 
 class CityDuck(AbsDuck):
 
-    def __int__(self):
-        super().__int__(CannotFly(), MuteQuack())
+    def __init__(self):
+        super().__init__(CANNOT_FLY, MUTE_QUACK)
 
     def dispaly(self):
         print('I am a city duck')
@@ -104,41 +105,35 @@ class CityDuck(AbsDuck):
 
 class WildDuck(AbsDuck):
 
-    def __int__(self):
-        super().__int__(CanFly(), Quack())
+    def __init__(self):
+        super().__init__(CAN_FLY, QUACK)
 
 
 class MountDuck(AbsDuck):
 
-    def __int__(self):
-        super().__int__(CanFly(), MuteQuack())
+    def __init__(self):
+        super().__init__(CAN_FLY, MUTE_QUACK)
 
 
 # Below is a more concrete Strategy Pattern example
-class AbsDataReader(ABC):
+class AbsDataReader(Protocol):
 
-    @abstractmethod
     def read(self):
         pass
 
-class AbsDataFixer(ABC):
+class AbsDataFixer(Protocol):
 
-    @abstractmethod
     def fix(self):
         pass
 
-class AbsDataSaver(ABC):
+class AbsDataSaver(Protocol):
 
-    @abstractmethod
     def save(self):
         pass
 
 class AbsDataBuilder(ABC):
 
-    def __int__(self, data_reader, data_fixer, data_saver):
-        assert isinstance(data_reader, AbsDataReader)
-        assert isinstance(data_fixer, AbsDataFixer)
-        assert isinstance(data_saver, AbsDataSaver)
+    def __init__(self, data_reader: AbsDataReader, data_fixer: AbsDataFixer, data_saver: AbsDataSaver):
         self.__data_reader = data_reader
         self.__data_fixer = data_fixer
         self.__data_saver = data_saver
@@ -154,9 +149,7 @@ class AbsDataBuilder(ABC):
 
 class AbsDataBuilder1(ABC):
 
-    def __int__(self, data_reader, data_saver):
-        assert isinstance(data_reader, AbsDataReader)
-        assert isinstance(data_saver, AbsDataSaver)
+    def __init__(self, data_reader: AbsDataReader, data_saver: AbsDataSaver):
         self.__data_reader = data_reader
         self.__data_saver = data_saver
 
@@ -171,8 +164,8 @@ class AbsDataBuilder1(ABC):
 
 class SimpleDataBuilder(AbsDataBuilder1):
 
-    def __int__(self):
-        super().__int__(...)
+    def __init__(self, data_reader, data_saver):
+        super().__init__(data_reader, data_saver)
 
     def fix(self):
         print('Perform some simple fix')
@@ -180,8 +173,31 @@ class SimpleDataBuilder(AbsDataBuilder1):
 
 class ComplexDataBuilder(AbsDataBuilder1):
 
-    def __int__(self):
-        super().__int__(...)
+    def __init__(self, data_reader, data_saver):
+        super().__init__(data_reader, data_saver)
 
     def fix(self):
-        print('Perform some complex fix')
\ No newline at end of file
+        print('Perform some complex fix')
+
+
+class Main(object):
+    """
+    $ python src/patterns/strategy.py
+
+    Can fly
+    quack
+    Cannot fly
+    << Silence >>
+    Can fly
+    << Silence >>
+    All ducks swim!
+    """
+
+    def main(self):
+        for duck in (WildDuck(), CityDuck(), MountDuck()):
+            duck.fly()
+            duck.quack()
+        WildDuck().swim()
+
+if __name__ == '__main__':
+    Main().main()